@@ -1,18 +1,49 @@
 import asyncio
 import datetime as dt
+import importlib.util
+import random
+import sys
+from importlib import metadata
 from logging import getLogger, Logger
-from typing import List
+from pathlib import Path
+from typing import Any, Callable, Coroutine, List, Optional, TypeVar, Union
 
 import httpx
+import orjson
 import pandas as pd
 
 from .enums import DateGranularity, AccessType, UserAgent
 from .types import (
     WikimediaRequest,
     PageStatistics,
-    PageStatisticsRecord,
+    statistics_to_df,
 )
 
+_RETRIABLE_STATUS_CODES = frozenset({429, 502, 503, 504})
+_MAX_RETRY_DELAY = 60
+
+T = TypeVar("T")
+
+try:
+    _VERSION = metadata.version("wikipedia-parser")
+except metadata.PackageNotFoundError:
+    _VERSION = "unknown"
+_USER_AGENT = f"wikipedia-parser/{_VERSION} (+https://github.com/loginchik/wikipedia-parser)"
+
+
+def _uvloop_attr(name: str) -> Any:
+    """
+    :param name: ``uvloop`` attribute name
+    :return: the attribute, or None if ``uvloop`` is not installed or not supported on the platform
+    """
+    if sys.platform == "win32":
+        return None
+    try:
+        import uvloop
+    except ImportError:
+        return None
+    return getattr(uvloop, name)
+
 
 class WikimediaParser:
     """
@@ -21,26 +52,184 @@ class WikimediaParser:
     Provides methods to collect statistics from Wikimedia pages. Use ``get_page_statistics``
     to gather information on 1 article, or ``get_multiple_pages_statistics`` to request multiple pages
     at the same time. The collected statistics can be concatenated into one pandas DataFrame
-    via ``concat_statistics`` method
+    via ``concat_statistics`` method.
+
+    The parser keeps one HTTP/2 client open between calls. Use it as an async context manager
+    or call ``aclose`` when done to release the connections
     """
 
-    def __init__(self, timeout: int = 60, max_connections: int = 10) -> None:
+    def __init__(
+        self,
+        timeout: int = 60,
+        max_connections: int = 10,
+        event_loop_policy: Optional["asyncio.AbstractEventLoopPolicy"] = None,
+        cache_path: Optional[Union[str, Path]] = None,
+        force_cache: bool = False,
+        max_retries: int = 3,
+        user_agent: Optional[str] = None,
+    ) -> None:
+        """
+        :param timeout: request timeout in seconds
+        :param max_connections: maximum number of simultaneous connections
+        :param event_loop_policy: asyncio event loop policy to install, e.g. ``uringcore.EventLoopPolicy()``
+            on Linux 5.11+. If not provided, ``uvloop`` policy is installed when available on Python < 3.14,
+            unless a non-default policy is already set.
+            Ignored if the parser is created inside a running event loop. Prefer ``WikimediaParser.run``,
+            as event loop policies are deprecated since Python 3.14
+        :param cache_path: path to SQLite database to cache responses in. Requires ``hishel``.
+            If not provided, responses are not cached
+        :param force_cache: use cached responses regardless of their age, without revalidation
+        :param max_retries: number of retries of a page request that failed with a transient status code
+            (429, 502, 503, 504) or a transport error, with exponential backoff or the delay
+            from ``Retry-After`` header
+        :param user_agent: User-Agent header to send. Wikimedia asks clients to identify themselves
+            with contact information, and may throttle requests otherwise
+        :raise ValueError: if ``max_retries`` is negative, or ``force_cache`` is set without ``cache_path``
+        :raise ImportError: if ``cache_path`` is set, but ``hishel`` is not installed
+        """
+        if max_retries < 0:
+            raise ValueError(f"max_retries must be a non-negative integer, got {max_retries}")
+        if force_cache and cache_path is None:
+            raise ValueError("force_cache requires cache_path to be set")
+        if cache_path is not None and not all(importlib.util.find_spec(m) for m in ("hishel", "anysqlite")):
+            raise ImportError('Responses cache requires hishel. Install it with: pip install "wikipedia-parser[cache]"')
+        self._install_event_loop_policy(event_loop_policy)
         self._client = None
+        self._client_loop = None
         self._logger = None
         self._timeout = timeout
         self._max_connections = max_connections
+        self._cache_path = cache_path
+        self._force_cache = force_cache
+        self._max_retries = max_retries
+        self._user_agent = user_agent or _USER_AGENT
+
+    @staticmethod
+    def _install_event_loop_policy(policy: Optional["asyncio.AbstractEventLoopPolicy"]) -> None:
+        """
+        Sets the event loop policy for the loops created afterward. Falls back to ``uvloop``
+        if no policy is provided, the package is installed and the current policy is the default one;
+        otherwise keeps the current policy.
+        Does nothing inside a running event loop, where the policy would not apply anyway
+
+        :param policy: event loop policy to install
+        """
+        try:
+            asyncio.get_running_loop()
+        except RuntimeError:
+            pass
+        else:
+            if policy is not None:
+                getLogger("wikimedia.parser").warning(
+                    "Event loop is already running, event_loop_policy is ignored. Use WikimediaParser.run instead"
+                )
+            return
+        if policy is None:
+            if (
+                sys.version_info >= (3, 14)
+                or type(asyncio.get_event_loop_policy()) is not asyncio.DefaultEventLoopPolicy
+            ):
+                return
+            policy = _uvloop_attr("EventLoopPolicy")
+            if policy is None:
+                return
+            policy = policy()
+        asyncio.set_event_loop_policy(policy)
+
+    @staticmethod
+    def run(
+        coroutine: Coroutine[Any, Any, T],
+        loop_factory: Optional[Callable[[], asyncio.AbstractEventLoop]] = None,
+    ) -> T:
+        """
+        Runs the coroutine in a new event loop, like ``asyncio.run``.
+        Uses ``uvloop`` loop if no factory is provided and the package is installed
+
+        :param coroutine: coroutine to run, e.g. ``parser.get_multiple_pages_statistics(...)``
+        :param loop_factory: callable creating the event loop, e.g. ``uvloop.new_event_loop``
+        :return: coroutine result
+        """
+        if loop_factory is None:
+            loop_factory = _uvloop_attr("new_event_loop")
+        with asyncio.Runner(loop_factory=loop_factory) as runner:
+            return runner.run(coroutine)
 
     @property
     def client(self) -> httpx.AsyncClient:
+        """
+        HTTP client, created lazily. Connections are bound to the event loop they were opened in,
+        so the client is recreated if it is used from another event loop, e.g. by another ``run`` call
+        """
+        loop = self._running_loop()
+        if self._client is not None and self._client_loop is not None and self._client_loop is not loop:
+            self.logger.debug("Event loop changed, recreating HTTP client...")
+            self._client = None
         if self._client is None:
+            self._client_loop = loop
             self._client = httpx.AsyncClient(
                 base_url="https://wikimedia.org/api/rest_v1/metrics/pageviews/per-article",
                 timeout=httpx.Timeout(self._timeout),
                 follow_redirects=True,
-                limits=httpx.Limits(max_connections=self._max_connections),
+                headers={"Accept-Encoding": "gzip, br, zstd", "User-Agent": self._user_agent},
+                transport=self._build_transport(),
             )
         return self._client
 
+    @staticmethod
+    def _running_loop() -> Optional[asyncio.AbstractEventLoop]:
+        """
+        :return: running event loop, or None if called outside of one
+        """
+        try:
+            return asyncio.get_running_loop()
+        except RuntimeError:
+            return None
+
+    def _build_transport(self) -> httpx.AsyncBaseTransport:
+        """
+        Builds HTTP/2 transport for the client, wrapped into a caching one if ``cache_path`` is set
+
+        :return: client transport
+        """
+        transport = httpx.AsyncHTTPTransport(
+            http2=True,
+            limits=httpx.Limits(
+                max_connections=self._max_connections,
+                max_keepalive_connections=self._max_connections,
+            ),
+        )
+        if self._cache_path is None:
+            return transport
+
+        import hishel
+        from hishel.httpx import AsyncCacheTransport
+
+        return AsyncCacheTransport(
+            next_transport=transport,
+            storage=hishel.AsyncSqliteStorage(database_path=self._cache_path),
+            policy=hishel.SpecificationPolicy(cache_options=hishel.CacheOptions(allow_stale=self._force_cache)),
+        )
+
+    async def aclose(self) -> None:
+        """
+        Closes the underlying HTTP client, if it was opened.
+        The next request will lazily open a new one. A client opened in another,
+        possibly closed, event loop cannot be closed and is dropped
+        """
+        if self._client is not None:
+            if self._client_loop is None or self._client_loop is self._running_loop():
+                await self._client.aclose()
+            else:
+                self.logger.debug("HTTP client belongs to another event loop, dropping it without closing")
+            self._client = None
+            self._client_loop = None
+
+    async def __aenter__(self) -> "WikimediaParser":
+        return self
+
+    async def __aexit__(self, *exc_info) -> None:
+        await self.aclose()
+
     @property
     def logger(self) -> Logger:
         if self._logger is None:
@@ -54,11 +243,44 @@ class WikimediaParser:
         :param request: WikimediaRequest object with specified params
         :return: page statistics with all records
         """
-        response = await self.client.get(url=request.as_url)
-        if response.status_code != 200:
-            raise ConnectionError(f"Wikimedia page request failed with status code {response.status_code}")
+        for attempt in range(self._max_retries + 1):
+            try:
+                async with self.client.stream("GET", url=request.as_url) as response:
+                    if response.status_code == 200:
+                        items = orjson.loads(await response.aread())["items"]
+                        break
+                    if response.status_code not in _RETRIABLE_STATUS_CODES or attempt == self._max_retries:
+                        raise ConnectionError(f"Wikimedia page request failed with status code {response.status_code}")
+                    reason = f"status code {response.status_code}"
+                    delay = self._retry_delay(response, attempt)
+            except httpx.TransportError as e:
+                if attempt == self._max_retries:
+                    raise
+                reason = repr(e)
+                delay = self._retry_delay(None, attempt)
+            self.logger.debug(
+                f"Wikimedia page request failed with {reason}: {request.url}. Retrying in {delay:.1f}s..."
+            )
+            await asyncio.sleep(delay)
         self.logger.debug(f"Wikimedia page request succeeded: {request.url}")
-        return PageStatistics(*[PageStatisticsRecord.from_dict(elem) for elem in response.json()["items"]])
+        return PageStatistics.from_json(items)
+
+    @staticmethod
+    def _retry_delay(response: Optional[httpx.Response], attempt: int) -> float:
+        """
+        Calculates delay before the next attempt: the number of seconds from ``Retry-After`` header,
+        or exponential backoff if the header is missing, plus random jitter.
+        The delay is capped, as the waiting request keeps its concurrency slot
+
+        :param response: failed response, if any was received
+        :param attempt: number of the failed attempt, starting from 0
+        :return: delay in seconds
+        """
+        try:
+            delay = float(response.headers["Retry-After"])
+        except (AttributeError, KeyError, ValueError):
+            delay = 2**attempt
+        return min(delay, _MAX_RETRY_DELAY) + random.random()
 
     async def get_multiple_pages_statistics(
         self,
@@ -71,10 +293,12 @@ class WikimediaParser:
         chunk_size: int = 10,
     ) -> List[PageStatistics]:
         """
-        Gathers multiple pages' statistics in chunks
+        Gathers multiple pages' statistics concurrently
 
-        Splits the provided pages into an array of chunks, that are loaded simultaneously, and gathers the data.
-        If any loading process raises error, cancels all other tasks and throws the exception
+        Loads up to ``chunk_size`` pages at the same time: as soon as one page is loaded, the next one starts.
+        Duplicated pages are loaded once; the results follow the order of the first occurrences in ``pages``.
+        Transient failures are retried per page. If any loading process raises error,
+        cancels all other tasks and throws the exception
 
         :param start_date: start date
         :param end_date: end date
@@ -83,46 +307,49 @@ class WikimediaParser:
         :param access:
         :param agent:
         :param chunk_size: number of pages to load at the same time
-        :return: list of pages' statistics
-        """
-        collected = []
-        pages = list(set(pages))
-        for chunk in (pages[i : i + chunk_size] for i in range(0, len(pages), chunk_size)):
-            requests = [
-                WikimediaRequest(
-                    url=page,
-                    start_timestamp=start_date,
-                    end_timestamp=end_date,
-                    granularity=granularity,
-                    access=access,
-                    agent=agent,
-                )
-                for page in chunk
-            ]
-            tasks = [asyncio.create_task(self.get_page_statistics(req)) for req in requests]
-            try:
-                chunk_results = await asyncio.gather(*tasks)
-                collected.extend(chunk_results)
-            except Exception as e:
-                self.logger.warning("Error occurred while collecting pages. Cancelling remaining tasks...")
-                for task in tasks:
-                    if not task.done():
-                        task.cancel()
-                self.logger.debug("Remaining tasks cancelled.")
-                raise e
-        return collected
+        :return: list of pages' statistics, in the order of ``pages``
+        :raise ValueError: if ``chunk_size`` is less than 1
+        """
+        if chunk_size < 1:
+            raise ValueError(f"chunk_size must be a positive integer, got {chunk_size}")
+        pages = list(dict.fromkeys(pages))
+        requests = [
+            WikimediaRequest(
+                url=page,
+                start_timestamp=start_date,
+                end_timestamp=end_date,
+                granularity=granularity,
+                access=access,
+                agent=agent,
+            )
+            for page in pages
+        ]
+        semaphore = asyncio.Semaphore(chunk_size)
+
+        async def _run(req: WikimediaRequest) -> PageStatistics:
+            async with semaphore:
+                return await self.get_page_statistics(req)
+
+        try:
+            async with asyncio.TaskGroup() as group:
+                tasks = [group.create_task(_run(req)) for req in requests]
+        except ExceptionGroup as e:
+            self.logger.warning("Error occurred while collecting pages. Remaining tasks cancelled.")
+            raise e.exceptions[0]
+        return [task.result() for task in tasks]
 
     @staticmethod
     def concat_statistics(*statistics: PageStatistics) -> pd.DataFrame:
         """
-        Converts statistics into pandas DataFrames and concatenates them.
-        Preserves uniqueness of the collected data
+        Converts statistics into one pandas DataFrame.
+        Preserves uniqueness of the collected data: records are unique within each statistics,
+        so duplicates are only dropped if the same page is passed more than once
 
         :param statistics: statistics
         :return: pandas DataFrame
         """
-        return (
-            pd.concat([st.to_df() for st in statistics], ignore_index=True, axis=0)
-            .drop_duplicates()
-            .reset_index(drop=True)
-        )
+        df = statistics_to_df(statistics)
+        pages = {(st.project, st.article, st.granularity, st.access, st.agent) for st in statistics}
+        if len(pages) < len(statistics):
+            df = df.drop_duplicates(keep="first", ignore_index=True)
+        return df
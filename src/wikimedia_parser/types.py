@@ -1,16 +1,38 @@
 import datetime as dt
+import operator
 import re
-from typing import NamedTuple, Dict, Any, Tuple
+from dataclasses import dataclass
+from functools import lru_cache
+from typing import NamedTuple, Dict, Any, Tuple, Iterable, List, Callable, Sequence
 
 import numpy as np
 import pandas as pd
 
 from .enums import DateGranularity, AccessType, UserAgent
 
+_URL_RE = re.compile(r"https://(\w+\.wikipedia)\.org/wiki/([^/#]+)")
+_GRANULARITIES = {g.value: g for g in DateGranularity}
+_ACCESS_TYPES = {a.value: a for a in AccessType}
+_USER_AGENTS = {ua.value: ua for ua in UserAgent}
 
-class PageStatisticsRecord(NamedTuple):
+
+@lru_cache(maxsize=4096)
+def _parse_timestamp(timestamp: str) -> dt.date:
+    """
+    Converts response timestamp of ``%Y%m%d00`` format into a date
+
+    :param timestamp: timestamp from the response
+    :return: date
+    """
+    return dt.date(int(timestamp[:4]), int(timestamp[4:6]), int(timestamp[6:8]))
+
+
+@dataclass(frozen=True, slots=True, eq=False)
+class PageStatisticsRecord:
     """
     One row of a returned data
+
+    Records are compared and hashed by all fields except ``views``
     """
 
     project: str
@@ -29,13 +51,21 @@ class PageStatisticsRecord(NamedTuple):
         :param data: dictionary from the response
         :return: item of a class
         """
-        updated_data = data.copy()
-        updated_data["timestamp"] = dt.datetime.strptime(data["timestamp"], "%Y%m%d00").date()
-        updated_data["access"] = AccessType(data["access"])
-        updated_data["granularity"] = DateGranularity(data["granularity"])
-        updated_data["agent"] = UserAgent(data["agent"])
-        updated_data["views"] = int(data["views"])
-        return cls(**updated_data)
+        return cls(
+            project=data["project"],
+            article=data["article"],
+            granularity=_GRANULARITIES.get(data["granularity"]) or DateGranularity(data["granularity"]),
+            timestamp=_parse_timestamp(data["timestamp"]),
+            access=_ACCESS_TYPES.get(data["access"]) or AccessType(data["access"]),
+            agent=_USER_AGENTS.get(data["agent"]) or UserAgent(data["agent"]),
+            views=int(data["views"]),
+        )
+
+    def _key(self) -> Tuple[str, str, DateGranularity, dt.date, AccessType, UserAgent]:
+        """
+        :return: fields identifying the record, i.e. all but ``views``
+        """
+        return self.project, self.article, self.granularity, self.timestamp, self.access, self.agent
 
     def __hash__(self):
         return hash((self.project, self.article, self.granularity, self.timestamp, self.access, self.agent))
@@ -43,38 +73,151 @@ class PageStatisticsRecord(NamedTuple):
     def __eq__(self, other: "PageStatisticsRecord") -> bool:
         if not isinstance(other, PageStatisticsRecord):
             return NotImplemented
-        return all(
-            [
-                getattr(self, attr) == getattr(other, attr)
-                for attr in ["project", "article", "granularity", "timestamp", "access", "agent"]
-            ]
-        )
+        return self._key() == other._key()
+
+
+_SHARED_FIELDS = ("project", "article", "granularity", "access", "agent")
+
+
+def _check_consistency(rows: Sequence[Any], getter: Callable[[Any], Tuple]) -> None:
+    """
+    Checks that all rows belong to the same page and request, i.e. share ``_SHARED_FIELDS``
+
+    :param rows: records or response items
+    :param getter: callable extracting shared fields from a row
+    :raise ValueError: if any row differs from the first one
+    """
+    first = getter(rows[0])
+    if any(getter(row) != first for row in rows):
+        raise ValueError("Inconsistent records")
+
+
+def statistics_to_df(statistics: Iterable["PageStatistics"]) -> pd.DataFrame:
+    """
+    Converts statistics into one pandas DataFrame, building each column at once
+    from the statistics' columns
+
+    :param statistics: statistics to convert
+    :return: pandas DataFrame
+    """
+    statistics = list(statistics)
+    counts = [st.records_count for st in statistics]
+
+    def _repeat(attr: str) -> pd.Categorical:
+        return pd.Categorical(np.repeat(np.array([getattr(st, attr) for st in statistics], dtype=object), counts))
+
+    return pd.DataFrame(
+        {
+            "project": _repeat("project"),
+            "article": _repeat("article"),
+            "granularity": _repeat("granularity"),
+            "timestamp": np.concatenate([st._columns["timestamp"] for st in statistics]).astype("datetime64[ns]"),
+            "access": _repeat("access"),
+            "agent": _repeat("agent"),
+            "views": np.concatenate([st._columns["views"] for st in statistics]),
+        },
+        copy=False,
+    )
 
 
 class PageStatistics:
     """
     One article statistics
+
+    Records are stored column-wise: timestamps and views as NumPy arrays, and the fields shared
+    by all records as attributes. ``records`` rebuilds ``PageStatisticsRecord`` items on demand
     """
 
     def __init__(self, *records: PageStatisticsRecord) -> None:
-        self.article = records[0].article
-        self.granularity = records[0].granularity
-        self.access = records[0].access
-        self.agent = records[0].agent
-        self.project = records[0].project
-
-        if any(
-            [
-                record.article != self.article
-                or record.granularity != self.granularity
-                or record.access != self.access
-                or record.agent != self.agent
-                or record.project != self.project
-                for record in records
-            ]
-        ):
-            raise ValueError("Inconsistent records")
-        self.records = sorted(list(set(records)), key=lambda r: r.timestamp)
+        _check_consistency(records, operator.attrgetter(*_SHARED_FIELDS))
+        first = records[0]
+        self._set_columns(
+            project=first.project,
+            article=first.article,
+            granularity=first.granularity,
+            access=first.access,
+            agent=first.agent,
+            timestamps=np.array([record.timestamp for record in records], dtype="datetime64[D]"),
+            views=np.fromiter((record.views for record in records), dtype=np.int64, count=len(records)),
+        )
+
+    @classmethod
+    def from_json(cls, items: List[Dict[str, Any]]) -> "PageStatistics":
+        """
+        Builds statistics from the response items column-wise, without creating
+        a ``PageStatisticsRecord`` per item
+
+        :param items: items from the response
+        :return: page statistics
+        :raise ValueError: if items belong to different pages or requests
+        """
+        _check_consistency(items, operator.itemgetter(*_SHARED_FIELDS))
+        first = items[0]
+        statistics = cls.__new__(cls)
+        statistics._set_columns(
+            project=first["project"],
+            article=first["article"],
+            granularity=_GRANULARITIES.get(first["granularity"]) or DateGranularity(first["granularity"]),
+            access=_ACCESS_TYPES.get(first["access"]) or AccessType(first["access"]),
+            agent=_USER_AGENTS.get(first["agent"]) or UserAgent(first["agent"]),
+            timestamps=np.array([_parse_timestamp(item["timestamp"]) for item in items], dtype="datetime64[D]"),
+            views=np.fromiter((int(item["views"]) for item in items), dtype=np.int64, count=len(items)),
+        )
+        return statistics
+
+    def _set_columns(
+        self,
+        project: str,
+        article: str,
+        granularity: DateGranularity,
+        access: AccessType,
+        agent: UserAgent,
+        timestamps: np.ndarray,
+        views: np.ndarray,
+    ) -> None:
+        """
+        Stores the columns, keeping the first record per timestamp, sorted by timestamp
+
+        :param timestamps: records' timestamps, ``datetime64[D]``
+        :param views: records' views, ``int64``
+        """
+        self.project = project
+        self.article = article
+        self.granularity = granularity
+        self.access = access
+        self.agent = agent
+
+        timestamps, first_indices = np.unique(timestamps, return_index=True)
+        self._columns: Dict[str, np.ndarray] = {"timestamp": timestamps, "views": views[first_indices]}
+        self._total_views = int(self._columns["views"].sum())
+
+    def _record(self, timestamp: dt.date, views: int) -> PageStatisticsRecord:
+        """
+        Builds one record of the article
+
+        :param timestamp: record timestamp
+        :param views: record views
+        :return: record
+        """
+        return PageStatisticsRecord(
+            project=self.project,
+            article=self.article,
+            granularity=self.granularity,
+            timestamp=timestamp,
+            access=self.access,
+            agent=self.agent,
+            views=views,
+        )
+
+    @property
+    def records(self) -> Tuple[PageStatisticsRecord, ...]:
+        """
+        :return: records sorted by timestamp
+        """
+        return tuple(
+            self._record(timestamp, views)
+            for timestamp, views in zip(self._columns["timestamp"].tolist(), self._columns["views"].tolist())
+        )
 
     def to_df(self) -> pd.DataFrame:
         """
@@ -82,49 +225,44 @@ class PageStatistics:
 
         :return: pandas DataFrame
         """
-        df = pd.DataFrame([record._asdict() for record in self.records])
-        df["granularity"] = pd.Categorical(df["granularity"])
-        df["access"] = pd.Categorical(df["access"])
-        df["agent"] = pd.Categorical(df["agent"])
-        df["project"] = pd.Categorical(df["project"])
-        df["article"] = pd.Categorical(df["article"])
-        df["timestamp"] = pd.to_datetime(df["timestamp"], format="%Y-%m-%d")
-        return df
+        return statistics_to_df([self])
 
     @property
     def records_count(self) -> int:
         """
         :return: number of records stored
         """
-        return len(self.records)
+        return len(self._columns["views"])
 
     @property
     def start_date(self) -> dt.date:
         """
         :return: earliest date of the records
         """
-        return sorted(self.records, key=lambda r: r.timestamp)[0].timestamp
+        return self._columns["timestamp"][0].item()
 
     @property
     def end_date(self) -> dt.date:
         """
         :return: latest date of the records
         """
-        return sorted(self.records, key=lambda r: r.timestamp)[-1].timestamp
+        return self._columns["timestamp"][-1].item()
 
     @property
     def top_views_record(self) -> PageStatisticsRecord:
         """
-        :return: the record with the most number of views
+        :return: the record with the most number of views, the latest one if several records share it
         """
-        return sorted(self.records, key=lambda r: r.views)[-1]
+        views = self._columns["views"]
+        index = len(views) - 1 - int(views[::-1].argmax())
+        return self._record(self._columns["timestamp"][index].item(), int(self._columns["views"][index]))
 
     @property
     def total_views(self) -> int:
         """
         :return: total number of views stored in the article
         """
-        return int(np.sum([record.views for record in self.records]))
+        return self._total_views
 
     @property
     def url(self) -> str:
@@ -153,13 +291,13 @@ class WikimediaRequest(NamedTuple):
         :return: prepared URL path to pass into parser's client
         """
         project, article = self._parse_url()
-        start_timestamp, end_timestamp = list(
-            map(
-                lambda x: x.strftime("%Y%m%d00"),
-                sorted([self.start_timestamp, self.end_timestamp]),
-            )
+        start, end = self.start_timestamp, self.end_timestamp
+        if start > end:
+            start, end = end, start
+        return (
+            f"/{project}/{self.access.value}/{self.agent.value}/{article}/{self.granularity.value}"
+            f"/{start:%Y%m%d}00/{end:%Y%m%d}00"
         )
-        return f"/{project}/{self.access.value}/{self.agent.value}/{article}/{self.granularity.value}/{start_timestamp}/{end_timestamp}"
 
     def _parse_url(self) -> Tuple[str, str]:
         """
@@ -169,8 +307,20 @@ class WikimediaRequest(NamedTuple):
         :return: project, article
         :raise ValueError: if unable to process regular expression
         """
-        try:
-            project, article = re.match(r"https://(\w+\.wikipedia).org/wiki/([^/#]+)", self.url).groups()
-            return project, article
-        except AttributeError as e:
-            raise ValueError(f"Unprocessable URL: {self.url}. Unable to extract project and article title") from e
+        return _parse_page_url(self.url)
+
+
+@lru_cache(maxsize=4096)
+def _parse_page_url(url: str) -> Tuple[str, str]:
+    """
+    Cached URL parsing shared by all requests to the same page
+
+    :param url: full URL to Wiki page
+    :return: project, article
+    :raise ValueError: if unable to process regular expression
+    """
+    try:
+        project, article = _URL_RE.match(url).groups()
+        return project, article
+    except AttributeError as e:
+        raise ValueError(f"Unprocessable URL: {url}. Unable to extract project and article title") from e
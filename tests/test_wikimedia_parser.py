@@ -0,0 +1,232 @@
+import asyncio
+import datetime as dt
+import sys
+
+import httpx
+import pytest
+
+from src.wikimedia_parser.parser import WikimediaParser
+from src.wikimedia_parser.types import PageStatisticsRecord, PageStatistics, WikimediaRequest
+from src.wikimedia_parser.enums import DateGranularity, AccessType, UserAgent
+
+
+def test_concat_statistics() -> None:
+    pages = [PageStatistics(*[PageStatisticsRecord(
+        project='project', article=article, granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1) + dt.timedelta(days=i),
+        access=AccessType.Any, agent=UserAgent.Any, views=10
+    ) for i in range(5)]) for article in ['article', 'article-1', 'article']]
+
+    df = WikimediaParser.concat_statistics(*pages)
+    assert df.shape[0] == 10
+    assert list(df.index) == list(range(10))
+    assert set(df['article']) == {'article', 'article-1'}
+
+    df = WikimediaParser.concat_statistics(*pages[:2])
+    assert df.shape[0] == 10
+    assert list(df.index) == list(range(10))
+
+
+def _mock_handler(request: httpx.Request) -> httpx.Response:
+    *_, project, access, agent, article, granularity, start, _ = request.url.path.split('/')
+    return httpx.Response(200, json={'items': [{
+        'project': project, 'article': article, 'granularity': granularity, 'timestamp': start,
+        'access': access, 'agent': agent, 'views': 10
+    }]})
+
+
+def test_get_multiple_pages_statistics_order() -> None:
+    pages = [f'https://en.wikipedia.org/wiki/article-{i}' for i in [3, 1, 2, 1, 3, 0]]
+
+    async def collect() -> list:
+        parser = WikimediaParser()
+        parser._client = httpx.AsyncClient(transport=httpx.MockTransport(_mock_handler), base_url='https://test')
+        async with parser:
+            return await parser.get_multiple_pages_statistics(dt.date(2025, 1, 1), dt.date(2025, 1, 2), pages,
+                                                              chunk_size=2)
+
+    result = asyncio.run(collect())
+    assert [page.article for page in result] == ['article-3', 'article-1', 'article-2', 'article-0']
+
+
+@pytest.mark.parametrize('chunk_size', [0, -1])
+def test_get_multiple_pages_statistics_invalid_chunk_size(chunk_size: int) -> None:
+    with pytest.raises(ValueError):
+        asyncio.run(WikimediaParser().get_multiple_pages_statistics(
+            dt.date(2025, 1, 1), dt.date(2025, 1, 2), ['https://en.wikipedia.org/wiki/article'], chunk_size=chunk_size
+        ))
+
+
+@pytest.mark.parametrize(('failures', 'max_retries', 'succeeded'), [
+    (0, 0, True),
+    (2, 2, True),
+    (3, 2, False),
+    (2, 1, False),
+])
+def test_get_page_statistics_retries(monkeypatch: pytest.MonkeyPatch, failures: int, max_retries: int,
+                                     succeeded: bool) -> None:
+    monkeypatch.setattr(WikimediaParser, '_retry_delay', staticmethod(lambda response, attempt: 0.0))
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if len(calls) <= failures:
+            if len(calls) % 2:
+                raise httpx.ConnectError('connection reset', request=request)
+            return httpx.Response(503, headers={'Retry-After': '0'})
+        return _mock_handler(request)
+
+    async def collect() -> PageStatistics:
+        parser = WikimediaParser(max_retries=max_retries)
+        parser._client = httpx.AsyncClient(transport=httpx.MockTransport(handler), base_url='https://test')
+        async with parser:
+            return await parser.get_page_statistics(
+                WikimediaRequest('https://en.wikipedia.org/wiki/article', dt.date(2025, 1, 1), dt.date(2025, 1, 2))
+            )
+
+    if succeeded:
+        assert asyncio.run(collect()).records_count == 1
+    else:
+        with pytest.raises((ConnectionError, httpx.TransportError)):
+            asyncio.run(collect())
+    assert len(calls) == min(failures, max_retries) + 1
+
+
+def test_invalid_max_retries() -> None:
+    with pytest.raises(ValueError):
+        WikimediaParser(max_retries=-1)
+
+
+@pytest.mark.parametrize(('headers', 'attempt', 'delay'), [
+    ({'Retry-After': '5'}, 0, 5),
+    ({'Retry-After': '86400'}, 0, 60),
+    ({'Retry-After': 'Wed, 21 Oct 2015 07:28:00 GMT'}, 2, 4),
+    ({}, 10, 60),
+])
+def test_retry_delay(monkeypatch: pytest.MonkeyPatch, headers: dict, attempt: int, delay: float) -> None:
+    monkeypatch.setattr('random.random', lambda: 0.0)
+    assert WikimediaParser._retry_delay(httpx.Response(503, headers=headers), attempt) == delay
+    assert WikimediaParser._retry_delay(None, 1) == 2
+
+
+@pytest.mark.parametrize(('force_cache', 'upstream_calls'), [(False, 2), (True, 1)])
+def test_get_page_statistics_cache(monkeypatch: pytest.MonkeyPatch, tmp_path, force_cache: bool,
+                                   upstream_calls: int) -> None:
+    pytest.importorskip('hishel')
+    pytest.importorskip('anysqlite')
+    calls = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        calls.append(request)
+        if request.headers.get('If-None-Match') == '"v1"':
+            return httpx.Response(304, headers={'ETag': '"v1"', 'Cache-Control': 'max-age=0'})
+        response = _mock_handler(request)
+        response.headers.update({'ETag': '"v1"', 'Cache-Control': 'max-age=0'})
+        return response
+
+    monkeypatch.setattr(httpx, 'AsyncHTTPTransport', lambda **kwargs: httpx.MockTransport(handler))
+    request = WikimediaRequest('https://en.wikipedia.org/wiki/article', dt.date(2025, 1, 1), dt.date(2025, 1, 2))
+
+    async def collect() -> list:
+        async with WikimediaParser(cache_path=tmp_path / 'cache.db', force_cache=force_cache) as parser:
+            return [await parser.get_page_statistics(request) for _ in range(2)]
+
+    result = asyncio.run(collect())
+    assert [page.total_views for page in result] == [10, 10]
+    assert len(calls) == upstream_calls
+    if not force_cache:
+        assert calls[1].headers.get('If-None-Match') == '"v1"'
+
+
+def test_force_cache_without_cache_path() -> None:
+    with pytest.raises(ValueError):
+        WikimediaParser(force_cache=True)
+
+
+def test_cache_path_without_hishel(monkeypatch: pytest.MonkeyPatch, tmp_path) -> None:
+    monkeypatch.setattr('importlib.util.find_spec', lambda name: None)
+    with pytest.raises(ImportError):
+        WikimediaParser(cache_path=tmp_path / 'cache.db')
+
+
+def test_event_loop_policy_ignored_in_running_loop() -> None:
+    policy = asyncio.get_event_loop_policy()
+
+    async def create() -> None:
+        WikimediaParser(event_loop_policy=asyncio.DefaultEventLoopPolicy())
+
+    asyncio.run(create())
+    assert asyncio.get_event_loop_policy() is policy
+
+
+def test_run_with_loop_factory() -> None:
+    loops = []
+
+    def loop_factory() -> asyncio.AbstractEventLoop:
+        loops.append(asyncio.new_event_loop())
+        return loops[-1]
+
+    async def current_loop() -> asyncio.AbstractEventLoop:
+        return asyncio.get_running_loop()
+
+    assert WikimediaParser.run(current_loop(), loop_factory=loop_factory) is loops[0]
+
+
+@pytest.mark.parametrize('user_agent', [None, 'my-tool/1.0 (contact@example.com)'])
+def test_client_headers(monkeypatch: pytest.MonkeyPatch, user_agent: str) -> None:
+    sent = []
+
+    def handler(request: httpx.Request) -> httpx.Response:
+        sent.append(request)
+        return _mock_handler(request)
+
+    monkeypatch.setattr(httpx, 'AsyncHTTPTransport', lambda **kwargs: httpx.MockTransport(handler))
+
+    async def collect() -> None:
+        async with WikimediaParser(user_agent=user_agent) as parser:
+            await parser.get_page_statistics(
+                WikimediaRequest('https://en.wikipedia.org/wiki/article', dt.date(2025, 1, 1), dt.date(2025, 1, 2))
+            )
+
+    asyncio.run(collect())
+    assert sent[0].headers['Accept-Encoding'] == 'gzip, br, zstd'
+    if user_agent is None:
+        assert sent[0].headers['User-Agent'].startswith('wikipedia-parser/')
+        assert 'github.com/loginchik/wikipedia-parser' in sent[0].headers['User-Agent']
+    else:
+        assert sent[0].headers['User-Agent'] == user_agent
+
+
+def test_client_recreated_in_new_event_loop() -> None:
+    parser = WikimediaParser()
+
+    async def get_client() -> httpx.AsyncClient:
+        return parser.client
+
+    first = WikimediaParser.run(get_client())
+    second = WikimediaParser.run(get_client())
+    assert first is not second
+    WikimediaParser.run(parser.aclose())
+
+
+@pytest.mark.skipif(sys.version_info >= (3, 14), reason='event loop policies are deprecated')
+@pytest.mark.parametrize('custom', [False, True])
+def test_uvloop_policy_fallback(monkeypatch: pytest.MonkeyPatch, custom: bool) -> None:
+    class FallbackPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    class CallerPolicy(asyncio.DefaultEventLoopPolicy):
+        pass
+
+    monkeypatch.setattr('src.wikimedia_parser.parser._uvloop_attr', lambda name: FallbackPolicy)
+    previous = asyncio.get_event_loop_policy()
+    caller_policy = CallerPolicy() if custom else asyncio.DefaultEventLoopPolicy()
+    asyncio.set_event_loop_policy(caller_policy)
+    try:
+        WikimediaParser()
+        if custom:
+            assert asyncio.get_event_loop_policy() is caller_policy
+        else:
+            assert isinstance(asyncio.get_event_loop_policy(), FallbackPolicy)
+    finally:
+        asyncio.set_event_loop_policy(previous)
@@ -1,4 +1,6 @@
+import dataclasses
 import datetime as dt
+import pickle
 
 import pandas as pd
 import pytest
@@ -26,10 +28,24 @@ def test_record_from_dict(access: str, granularity: str, user_agent: str) -> Non
     assert isinstance(result.granularity, DateGranularity)
     assert isinstance(result.agent, UserAgent)
     assert isinstance(result.views, int)
+    assert result.timestamp == dt.date(2025, 1, 1)
     assert result.project == 'ru.wikipedia'
     assert result.article == 'test-article'
 
 
+def test_record_from_dict_unknown_value() -> None:
+    with pytest.raises(ValueError):
+        PageStatisticsRecord.from_dict({
+            'timestamp': '2025010100',
+            'access': 'unknown',
+            'granularity': DateGranularity.Daily.value,
+            'agent': UserAgent.User.value,
+            'views': 100,
+            'project': 'ru.wikipedia',
+            'article': 'test-article'
+        })
+
+
 @pytest.mark.parametrize(('this', 'other', 'result'), [
     (
             PageStatisticsRecord(
@@ -73,6 +89,7 @@ def test_record_from_dict(access: str, granularity: str, user_agent: str) -> Non
 ])
 def test_records_equal(this: PageStatisticsRecord, other: PageStatisticsRecord, result: bool) -> None:
     assert (this == other) is result
+    assert (this != other) is not result
 
 
 def test_records_set() -> None:
@@ -84,6 +101,20 @@ def test_records_set() -> None:
     assert len(list(set(data))) == 1
 
 
+def test_record_pickle_and_asdict() -> None:
+    record = PageStatisticsRecord(
+        project='project', article='article', granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1), access=AccessType.Any, agent=UserAgent.Any, views=10
+    )
+    restored = pickle.loads(pickle.dumps(record))
+    assert restored == record
+    assert restored in {record}
+    assert restored.views == 10
+    assert list(dataclasses.asdict(record)) == [
+        'project', 'article', 'granularity', 'timestamp', 'access', 'agent', 'views'
+    ]
+
+
 def test_page_statistics_init_success() -> None:
     data = [PageStatisticsRecord(
         project='project', article='article', granularity=DateGranularity.Daily,
@@ -105,6 +136,100 @@ def test_page_statistics_init_success() -> None:
     assert page.to_df().shape[0] == 10
 
 
+def test_page_statistics_to_df_types() -> None:
+    data = [PageStatisticsRecord(
+        project='project', article='article', granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1) + dt.timedelta(days=i),
+        access=AccessType.Any, agent=UserAgent.User, views=i
+    ) for i in range(3)]
+    fields = ['project', 'article', 'granularity', 'timestamp', 'access', 'agent', 'views']
+    expected = pd.DataFrame([{field: getattr(record, field) for field in fields} for record in data])
+    for column in ['project', 'article', 'granularity', 'access', 'agent']:
+        expected[column] = pd.Categorical(expected[column])
+    expected['timestamp'] = pd.to_datetime(expected['timestamp'], format='%Y-%m-%d')
+
+    df = PageStatistics(*data).to_df()
+    pd.testing.assert_frame_equal(df, expected)
+    assert df.dtypes.to_dict() == expected.dtypes.to_dict()
+    assert [type(df[column].iloc[0]) for column in fields] == [type(expected[column].iloc[0]) for column in fields]
+    assert isinstance(df['granularity'].iloc[0], DateGranularity)
+
+
+def test_page_statistics_unordered_records() -> None:
+    data = [PageStatisticsRecord(
+        project='project', article='article', granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1) + dt.timedelta(days=i),
+        access=AccessType.Any, agent=UserAgent.Any, views=views
+    ) for i, views in [(3, 5), (0, 20), (7, 40), (2, 10)]]
+
+    page = PageStatistics(*data)
+    assert page.start_date == dt.date(2025, 1, 1)
+    assert page.end_date == dt.date(2025, 1, 8)
+    assert page.top_views_record.views == 40
+    assert page.total_views == 75
+
+
+def test_page_statistics_duplicated_records() -> None:
+    data = [PageStatisticsRecord(
+        project='project', article='article', granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1) + dt.timedelta(days=i % 3),
+        access=AccessType.Any, agent=UserAgent.Any, views=10
+    ) for i in range(9)]
+
+    page = PageStatistics(*data)
+    assert page.records_count == 3
+    assert page.total_views == 30
+    assert [r.timestamp for r in page.records] == [dt.date(2025, 1, 1), dt.date(2025, 1, 2), dt.date(2025, 1, 3)]
+
+
+def test_page_statistics_from_json() -> None:
+    items = [{
+        'timestamp': f'202501{day:02d}00',
+        'access': AccessType.Any.value,
+        'granularity': DateGranularity.Daily.value,
+        'agent': UserAgent.User.value,
+        'views': day * 10,
+        'project': 'ru.wikipedia',
+        'article': 'test-article'
+    } for day in [3, 1, 2, 1]]
+
+    page = PageStatistics.from_json(items)
+    expected = PageStatistics(*[PageStatisticsRecord.from_dict(item) for item in items])
+    assert [(r.timestamp, r.views) for r in page.records] == [(r.timestamp, r.views) for r in expected.records]
+    assert [(r.timestamp, r.views) for r in page.records] == [
+        (dt.date(2025, 1, 1), 10), (dt.date(2025, 1, 2), 20), (dt.date(2025, 1, 3), 30)
+    ]
+    assert page.records_count == 3
+    assert page.start_date == dt.date(2025, 1, 1)
+    assert page.end_date == dt.date(2025, 1, 3)
+    assert page.total_views == 60
+    assert page.top_views_record.timestamp == dt.date(2025, 1, 3)
+    assert isinstance(page.agent, UserAgent)
+
+    with pytest.raises(ValueError):
+        PageStatistics.from_json([*items, {**items[0], 'article': 'another-article'}])
+
+
+def test_page_statistics_inconsistent_records() -> None:
+    data = [PageStatisticsRecord(
+        project='project', article=article, granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1), access=AccessType.Any, agent=UserAgent.Any, views=10
+    ) for article in ['article', 'article-1']]
+
+    with pytest.raises(ValueError):
+        PageStatistics(*data)
+
+
+def test_page_statistics_top_views_record_tie() -> None:
+    data = [PageStatisticsRecord(
+        project='project', article='article', granularity=DateGranularity.Daily,
+        timestamp=dt.date(2025, 1, 1) + dt.timedelta(days=i),
+        access=AccessType.Any, agent=UserAgent.Any, views=views
+    ) for i, views in enumerate([10, 10, 5])]
+
+    assert PageStatistics(*data).top_views_record.timestamp == dt.date(2025, 1, 2)
+
+
 @pytest.mark.parametrize(('url', 'project', 'article'), [
     ('https://ru.wikipedia.org/wiki/article', 'ru.wikipedia', 'article'),
     ('https://en.wikipedia.org/wiki/another_article,yes', 'en.wikipedia', 'another_article,yes')
@@ -134,3 +259,8 @@ def test_request_to_url(granularity: DateGranularity, access: AccessType, agent:
     )
     expected_url = f'/ru.wikipedia/{access.value}/{agent.value}/article-yes/{granularity.value}/2025010100/2025011000'
     assert expected_url == request.as_url
+
+
+def test_request_parse_url_invalid() -> None:
+    with pytest.raises(ValueError):
+        WikimediaRequest('https://ru.wikipediaXorg/wiki/article', dt.date(2025, 1, 1), dt.date(2025, 1, 12))._parse_url()